@@ -1,104 +1,418 @@
-import os, sys
-currentdir = os.path.dirname(os.path.realpath(__file__))
-sys.path.append(os.path.dirname(os.path.dirname(currentdir)))
-from LoRaRF import SX127x #, LoRaSpi, LoRaGpio
-import time
-
-# Begin LoRa radio with connected SPI bus and IO pins (cs and reset) on GPIO
-# SPI is defined by bus ID and cs ID and IO pins defined by chip and offset number
-#spi = LoRaSpi(0, 0)
-#cs = LoRaGpio(0, 8)
-#reset = LoRaGpio(0, 24)
-#irq = LoRaGpio(0, 17)
-LoRa = SX127x()
-LoRa.setPins(22, 26, -1, -1)
-print("Begin LoRa radio")
-if not LoRa.begin() :
-    raise Exception("Something wrong, can't begin LoRa radio")
-
-# Set frequency to 915 Mhz
-print("Set frequency to 915 Mhz")
-LoRa.setFrequency(915000000)
-
-# Set RX gain to boosted gain
-print("Set RX gain to boosted gain")
-LoRa.setRxGain(LoRa.RX_GAIN_BOOSTED, LoRa.RX_GAIN_AUTO)
-
-# Configure modulation parameter including spreading factor (SF), bandwidth (BW), and coding rate (CR)
-print("Set modulation parameters:\n\tSpreading factor = 7\n\tBandwidth = 125 kHz\n\tCoding rate = 4/5")
-LoRa.setSpreadingFactor(7)
-LoRa.setBandwidth(125000)
-LoRa.setCodeRate(5)
-
-# Configure packet parameter including header type, preamble length, payload length, and CRC type
-print("Set packet parameters:\n\tExplicit header type\n\tPreamble length = 12\n\tPayload Length = 15\n\tCRC on")
-LoRa.setHeaderType(LoRa.HEADER_EXPLICIT)
-LoRa.setPreambleLength(12)
-LoRa.setPayloadLength(255)
-LoRa.setCrcEnable(True)
-
-# Set syncronize word for public network (0x34)
-print("Set syncronize word to 0x34")
-LoRa.setSyncWord(0x34)
-
-print("\n-- LoRa Receiver Callback --\n")
-
-import RPi.GPIO as GPIO
-GPIO.setmode(GPIO.BCM)
-GPIO.setup(5, GPIO.OUT)
-GPIO.setup(6, GPIO.OUT)
-
-GPIO.output(6, GPIO.LOW)
-GPIO.output(5, GPIO.HIGH)
-
-
-# receive data container
-packetData = ()
-
-def getReceiveData() :
-
-    global packetData
-    # Store received data
-    packetData = LoRa.read(LoRa.available())
 """
-# Register callback function to be called every RX done
-LoRa.onReceive(getReceiveData)
+LoRa Receiver for SX1276 on Raspberry Pi Zero 2 W
+Receives messages from Pi Pico using standard radiolib and prints to console.
+Based on LoRaRF-Python library: https://github.com/chandrawi/LoRaRF-Python
 
-# Request for receiving new LoRa packet in RX continuous mode
-LoRa.request(LoRa.RX_CONTINUOUS)
+Defaults match the Pi Pico radiolib settings. To receive from transmit.py run:
+    python receiver.py --spreading-factor 7 --coding-rate 5 --sync-word 0x34 \
+        --preamble-length 12 --rx-gain boosted --txen-pin 6 --rxen-pin 5
+
+LoRaRF drives RXEN high and TXEN low while receiving, so the pin swap above
+holds GPIO5 high and GPIO6 low for the RF switch during RX.
+"""
+
+import argparse
+import asyncio
+import concurrent.futures
+import ctypes
+import fcntl
+import sys
+
+from LoRaRF import SX127x
+from LoRaRF.SX127x import spi as lora_spi
+
+
+class _SpiIocTransfer(ctypes.Structure):
+    """struct spi_ioc_transfer from linux/spi/spidev.h"""
+
+    _fields_ = [
+        ("tx_buf", ctypes.c_uint64),
+        ("rx_buf", ctypes.c_uint64),
+        ("len", ctypes.c_uint32),
+        ("speed_hz", ctypes.c_uint32),
+        ("delay_usecs", ctypes.c_uint16),
+        ("bits_per_word", ctypes.c_uint8),
+        ("cs_change", ctypes.c_uint8),
+        ("tx_nbits", ctypes.c_uint8),
+        ("rx_nbits", ctypes.c_uint8),
+        ("word_delay_usecs", ctypes.c_uint8),
+        ("pad", ctypes.c_uint8),
+    ]
+
+
+# SPI_IOC_MESSAGE(2) = _IOW('k', 0, char[2 * sizeof(struct spi_ioc_transfer)])
+_SPI_IOC_MESSAGE_2 = (
+    (1 << 30) | ((2 * ctypes.sizeof(_SpiIocTransfer)) << 16) | (ord("k") << 8)
+)
+
+# Reusable FIFO read buffer, sized for the largest explicit header payload
+_RX_BUF = bytearray(255)
+
+# FIFO burst read as one SPI message with chip select held across two
+# transfers: the FIFO register address (read, MSB clear), then the payload
+# clocked straight into _RX_BUF. Only the payload length changes per packet.
+_FIFO_ADDR = (ctypes.c_uint8 * 1)(SX127x.REG_FIFO & 0x7F)
+_RX_BUF_C = (ctypes.c_uint8 * len(_RX_BUF)).from_buffer(_RX_BUF)
+_FIFO_XFER = (_SpiIocTransfer * 2)()
+_FIFO_XFER[0].tx_buf = ctypes.addressof(_FIFO_ADDR)
+_FIFO_XFER[0].len = 1
+_FIFO_XFER[1].rx_buf = ctypes.addressof(_RX_BUF_C)
+
+# Packet report layout
+_PACKET_TEMPLATE = (
+    "[Packet #{}]\n"
+    "  Length: {} bytes\n"
+    "  Data: {}\n"
+    "  Hex: {}\n"
+    "  RSSI: {:0.2f} dBm | SNR: {:0.2f} dB\n\n"
+)
+
+
+def initialize_lora_receiver(
+    frequency: int = 915000000,
+    spreading_factor: int = 9,
+    bandwidth: int = 125000,
+    coding_rate: int = 7,
+    sync_word: int = 0x12,
+    preamble_length: int = 10,
+    reset_pin: int = 22,
+    dio1_pin: int = -1,
+    txen_pin: int = -1,
+    rxen_pin: int = -1,
+    rx_gain: int = SX127x.RX_GAIN_POWER_SAVING,
+    spi_speed_hz: int = 10000000,
+    rx_event: asyncio.Event | None = None,
+) -> SX127x:
+    """
+    Initialize LoRa module for receiving on SX1276.
+
+    Args:
+        frequency: Operating frequency in Hz (default: 915 MHz)
+        spreading_factor: Spreading factor 7-12 (default: 9, matches radiolib)
+        bandwidth: Bandwidth in Hz (default: 125000)
+        coding_rate: Coding rate 5-8, where 5=4/5, 6=4/6, 7=4/7, 8=4/8 (default: 7)
+        sync_word: Synchronization word (default: 0x12, RADIOLIB_SX127X_SYNC_WORD)
+        preamble_length: Preamble length in symbols (default: 10, matches radiolib)
+        reset_pin: GPIO pin for RESET (default: 22)
+        dio1_pin: GPIO pin wired to the DIO0 RX done interrupt (default: -1 unused)
+        txen_pin: GPIO pin for TXEN (default: -1 unused)
+        rxen_pin: GPIO pin for RXEN (default: -1 unused)
+        rx_gain: RX_GAIN_POWER_SAVING or RX_GAIN_BOOSTED (default: power saving)
+        spi_speed_hz: SPI clock in Hz (default: 10 MHz, SX1276 maximum)
+        rx_event: Event set on every RX done interrupt, requires dio1_pin
+            and a running event loop (default: None, poll IRQ register)
+
+    Returns:
+        Initialized SX127x LoRa object
+    """
+    # Initialize SX127x LoRa module
+    LoRa = SX127x()
+
+    if rx_event is not None and dio1_pin < 0:
+        raise ValueError("rx_event requires dio1_pin to be wired to DIO0")
+
+    # Begin initialization (required before any operations)
+    # begin() (re)applies the pin configuration, so pass the pins through it
+    if reset_pin >= 0:
+        begun = LoRa.begin(
+            reset=reset_pin, irq=dio1_pin, txen=txen_pin, rxen=rxen_pin
+        )
+    else:
+        begun = LoRa.begin()
+    if not begun:
+        raise RuntimeError("Something wrong, can't begin LoRa radio")
+
+    # begin() opens SPI at LoRaRF's default 7.8 MHz, run at the chip maximum
+    lora_spi.max_speed_hz = spi_speed_hz
+
+    # Wake up on the DIO0 edge instead of polling the IRQ register over SPI.
+    # LoRaRF calls onReceive from its GPIO thread, so hop back onto the loop.
+    if rx_event is not None:
+        loop = asyncio.get_running_loop()
+        LoRa.onReceive(lambda: loop.call_soon_threadsafe(rx_event.set))
+
+    # Configure frequency
+    LoRa.setFrequency(frequency)
+
+    # Configure transmit power (not needed for receive, but set anyway)
+    LoRa.setTxPower(14, LoRa.TX_POWER_RFO)
+
+    # Configure receive gain, AGC on
+    LoRa.setRxGain(rx_gain, LoRa.RX_GAIN_AUTO)
+
+    # Configure LoRa modulation parameters
+    # Low data rate optimization should be True for SF >= 11
+    # For SF=9, it's not needed (only for SF >= 11)
+    low_data_rate = spreading_factor >= 11
+    LoRa.setLoRaModulation(spreading_factor, bandwidth, coding_rate, low_data_rate)
+
+    # Configure LoRa packet parameters
+    # Use explicit header mode for variable length packets
+    # Maximum payload length for explicit header: 255 bytes
+    # Preamble length: 10 (matches radiolib begin parameter 6)
+    LoRa.setLoRaPacket(LoRa.HEADER_EXPLICIT, preamble_length, 255, True, False)
+
+    # Set synchronize word
+    LoRa.setSyncWord(sync_word)
+
+    print("LoRa SX1276 Receiver initialized successfully!")
+    print(f"  Frequency: {frequency / 1e6:.1f} MHz")
+    print(f"  Spreading Factor: {spreading_factor}")
+    print(f"  Bandwidth: {bandwidth} Hz")
+    print(f"  Coding Rate: {coding_rate} (4/{coding_rate})")
+    print(f"  Sync Word: 0x{sync_word:02X}")
+    print(f"  Preamble Length: {preamble_length} symbols")
+    boosted = rx_gain == LoRa.RX_GAIN_BOOSTED
+    print(f"  RX Gain: {'boosted' if boosted else 'power saving'}")
+    print("\nWaiting for messages...\n")
+
+    return LoRa
+
+
+async def receive_message(
+    lora: SX127x, rx_event: asyncio.Event | None = None
+) -> bytes:
+    """
+    Receive a message from LoRa.
+
+    Args:
+        lora: Initialized SX127x LoRa object
+        rx_event: Event set by the RX done interrupt, or None to poll with wait()
+
+    Returns:
+        Received message as bytes, or empty bytes if error
+    """
+    try:
+        # Request to receive
+        lora.request()
+
+        # Wait for reception
+        if rx_event is not None:
+            await rx_event.wait()
+            rx_event.clear()
+        else:
+            # wait() polls the IRQ register, run it off the event loop so the
+            # print task keeps going. Short timeouts keep shutdown from
+            # blocking on the worker thread.
+            loop = asyncio.get_running_loop()
+            while not await loop.run_in_executor(None, lora.wait, 0.5):
+                pass
+
+        # Payload length comes from the packet header (RegRxNbBytes), latched
+        # by LoRaRF at RX done, so read it once and trust it for the drain
+        length = lora.available()
+        if length <= 0:
+            return b""
+
+        # Burst read the whole payload into _RX_BUF with a single ioctl, the
+        # FIFO address pointer auto-increments
+        _FIFO_XFER[1].len = length
+        fcntl.ioctl(lora_spi.fileno(), _SPI_IOC_MESSAGE_2, _FIFO_XFER)
+        rx_view = memoryview(_RX_BUF)[:length]
+        lora.purge(length)
+
+        # Copy out, the buffer is reused for the next packet
+        return bytes(rx_view)
+    except Exception as e:
+        print(f"Error receiving message: {e}")
+        return b""
+
+
+def bytes_to_text(data: bytes) -> str:
+    """
+    Convert bytes to text, trying ASCII first, then UTF-8, then fallback to hex.
+
+    Args:
+        data: Bytes to convert
+
+    Returns:
+        String representation of the data
+    """
+    if not data:
+        return ""
+
+    # Remove null bytes that might be padding
+    stripped = data.rstrip(b"\x00")
+
+    # Fast path for plain ASCII payloads, skips the UTF-8 decoder
+    if stripped.isascii():
+        return stripped.decode("ascii")
+
+    # Not ASCII, so try UTF-8 (an ASCII retry could never succeed here)
+    try:
+        return stripped.decode("utf-8")
+    except UnicodeDecodeError:
+        pass
+
+    # Fallback to hex representation
+    return f"<hex: {data.hex()}>"
+
+
+def print_packet(
+    packet_count: int, message: bytes, rssi: float, snr: float, flush: bool = True
+) -> None:
+    """
+    Format a received packet and write it to stdout.
+
+    Args:
+        packet_count: Sequence number of the packet
+        message: Received payload
+        rssi: Packet RSSI in dBm
+        snr: Packet SNR in dB
+        flush: Flush stdout after writing (default: True)
+    """
+    # Convert to text
+    text = bytes_to_text(message)
+
+    # Print received message with a single write, through the same text
+    # stream as every other message so output stays in order
+    sys.stdout.write(
+        _PACKET_TEMPLATE.format(
+            packet_count, len(message), text, message.hex(), rssi, snr
+        )
+    )
+    # Flush once the backlog is drained so output is not held back
+    if flush:
+        sys.stdout.flush()
+
+async def run_receiver(**lora_config: int) -> None:
+    """
+    Initialize the LoRa receiver and print incoming packets forever.
+
+    Args:
+        **lora_config: Keyword arguments for initialize_lora_receiver
+    """
+    # Only use the interrupt path when DIO0 is actually wired
+    rx_event = asyncio.Event() if lora_config.get("dio1_pin", -1) >= 0 else None
+    lora = initialize_lora_receiver(**lora_config, rx_event=rx_event)
+
+    # Received packets with their RSSI and SNR, drained by the print task so
+    # the radio is re-armed without waiting on stdout
+    queue: asyncio.Queue[tuple[bytes, float, float]] = asyncio.Queue(maxsize=32)
+
+    async def rx_task() -> None:
+        while True:
+            # Receive message (waits until packet is received)
+            message = await receive_message(lora, rx_event)
+
+            # RX done is raised even when the payload CRC check failed
+            status = lora.status()
+            if message and status == lora.STATUS_CRC_ERR:
+                print(f"CRC error, dropped {len(message)} byte packet")
+            elif message and status == lora.STATUS_HEADER_ERR:
+                print(f"Packet header error, dropped {len(message)} byte packet")
+            elif message:
+                await queue.put((message, lora.packetRssi(), lora.snr()))
+            else:
+                # Empty message means a receive error or a spurious wake-up,
+                # back off briefly so a failing radio can't spin the CPU
+                await asyncio.sleep(0.01)
+
+    async def print_task() -> None:
+        loop = asyncio.get_running_loop()
+        packet_count = 0
+        # Format and write in a worker thread so the RX task keeps the loop
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+            while True:
+                message, rssi, snr = await queue.get()
+                packet_count += 1
+                await loop.run_in_executor(
+                    pool, print_packet, packet_count, message, rssi, snr, queue.empty()
+                )
+
+    async with asyncio.TaskGroup() as tg:
+        tg.create_task(rx_task())
+        tg.create_task(print_task())
 
-# Receive message continuously
-while True :
 
-    if packetData :
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """
+    Parse receiver command line options.
 
-        # Print received message and counter in serial
-        length = len(packetData) - 1
-        message = ""
-        for i in range(length) :
-            message += chr(packetData[i])
-        counter = packetData[length]
-        print(f"{message}  {counter}")
+    Args:
+        argv: Arguments to parse (default: None, use sys.argv)
 
-        # Print packet/signal status including RSSI, SNR, and signalRSSI
-        print("Packet status: RSSI = {0:0.2f} dBm | SNR = {1:0.2f} dB".format(LoRa.packetRssi(), LoRa.snr()))
+    Returns:
+        Parsed options
+    """
+    # Defaults MUST match your Pi Pico radiolib settings
+    # Based on: radio.begin(915.0, 125.0, 9, 7, RADIOLIB_SX127X_SYNC_WORD, 10, 8, 0)
+    parser = argparse.ArgumentParser(description="LoRa SX1276 receiver")
+    parser.add_argument(
+        "--frequency", type=int, default=915000000, help="Hz (default: 915 MHz)"
+    )
+    parser.add_argument(
+        "--spreading-factor", type=int, default=9, help="7-12 (default: 9)"
+    )
+    parser.add_argument(
+        "--bandwidth", type=int, default=125000, help="Hz (default: 125 kHz)"
+    )
+    parser.add_argument(
+        "--coding-rate", type=int, default=7, help="5-8, where 7 = 4/7 (default: 7)"
+    )
+    parser.add_argument(
+        "--sync-word",
+        type=lambda value: int(value, 0),
+        default=0x12,
+        help="default: 0x12, RADIOLIB_SX127X_SYNC_WORD",
+    )
+    parser.add_argument(
+        "--preamble-length", type=int, default=10, help="symbols (default: 10)"
+    )
+    parser.add_argument(
+        "--rx-gain",
+        choices=["power-saving", "boosted"],
+        default="power-saving",
+        help="LNA gain, AGC stays on (default: power-saving)",
+    )
 
-        # Reset receive data container
-   
+    # GPIO pin configuration (adjust if your wiring is different)
+    parser.add_argument("--reset-pin", type=int, default=22, help="default: 22")
+    parser.add_argument(
+        "--dio-pin",
+        type=int,
+        default=-1,
+        help="pin wired to DIO0 for the RX done interrupt (default: -1, poll)",
+    )
+    parser.add_argument("--txen-pin", type=int, default=-1, help="-1 means unused")
+    parser.add_argument("--rxen-pin", type=int, default=-1, help="-1 means unused")
+    return parser.parse_args(argv)
 
-   packetData = ()
 
-   """
+def main():
+    """Main receiver loop"""
+    args = parse_args()
 
-while True:
-    print("Starting receive")
-    LoRa.request()
-    LoRa.wait()
+    try:
+        asyncio.run(
+            run_receiver(
+                frequency=args.frequency,
+                spreading_factor=args.spreading_factor,
+                bandwidth=args.bandwidth,
+                coding_rate=args.coding_rate,
+                sync_word=args.sync_word,
+                preamble_length=args.preamble_length,
+                rx_gain=(
+                    SX127x.RX_GAIN_BOOSTED
+                    if args.rx_gain == "boosted"
+                    else SX127x.RX_GAIN_POWER_SAVING
+                ),
+                reset_pin=args.reset_pin,
+                dio1_pin=args.dio_pin,
+                txen_pin=args.txen_pin,
+                rxen_pin=args.rxen_pin,
+            )
+        )
+    except KeyboardInterrupt:
+        print("\n\nReceiver stopped by user")
+        sys.exit(0)
+    except Exception as e:
+        print(f"\nError: {e}")
+        import traceback
 
-    message = ""
+        traceback.print_exc()
+        sys.exit(1)
 
-    while LoRa.available() > 1:
-        message += chr(LoRa.read())
-    counter = LoRa.read()
 
-    print(f"{message} {counter}")
+if __name__ == "__main__":
+    main()